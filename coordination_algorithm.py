@@ -1,14 +1,110 @@
+import functools
+import io
+import math
+from collections import Counter
+from dataclasses import dataclass
+
 import numpy as np
 import json
+from scipy.optimize import linear_sum_assignment
 from typing import Dict, List, Tuple
 
+import _kernel
+
+# Precomputed fractional powers for the small integer inputs the complexity
+# formulas see (depth 1-6, a handful of element/type counts); indexing a
+# tuple replaces an interpreter-level pow call on the reference path
+_POW_TABLE_SIZE = 32
+_POW01 = tuple(i ** 0.1 for i in range(_POW_TABLE_SIZE))
+_POW02 = tuple(i ** 0.2 for i in range(_POW_TABLE_SIZE))
+_POW03 = tuple(i ** 0.3 for i in range(_POW_TABLE_SIZE))
+_POW04 = tuple(i ** 0.4 for i in range(_POW_TABLE_SIZE))
+_POW06 = tuple(i ** 0.6 for i in range(_POW_TABLE_SIZE))
+
+
+def _pow_small(x, table, exponent):
+    """Table lookup for x ** exponent, falling back to pow for large inputs"""
+    if isinstance(x, int) and 0 <= x < _POW_TABLE_SIZE:
+        return table[x]
+    return x ** exponent
+
+
+@dataclass(frozen=True, slots=True)
+class AssignmentBatch:
+    """Struct-of-arrays layout for one task's agent assignments.
+
+    Parallel arrays replace the per-assignment dicts on the hot path, so
+    aggregations like total coordination cost become single ndarray
+    reductions. Instances are shared through the decomposition cache —
+    treat the arrays as read-only and use to_dicts() for mutable copies.
+    """
+
+    subtask_type_ids: np.ndarray  # int codes into _kernel.SUBTASK_TYPE_NAMES
+    complexities: np.ndarray
+    priorities: np.ndarray
+    agent_ids: np.ndarray  # int8 ids into HierarchicalTaskDecomposition.AGENT_NAMES
+    confidences: np.ndarray
+    coord_costs: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.agent_ids)
+
+    def to_dicts(self) -> List[Dict]:
+        """Expand into the classic list-of-assignment-dicts structure"""
+        return [
+            {
+                "subtask": {
+                    "type": _kernel.SUBTASK_TYPE_NAMES[self.subtask_type_ids[i]],
+                    "complexity": float(self.complexities[i]),
+                    "priority": int(self.priorities[i]),
+                },
+                "assigned_agent": HierarchicalTaskDecomposition.AGENT_NAMES[self.agent_ids[i]],
+                "confidence_score": float(self.confidences[i]),
+                "coordination_cost": float(self.coord_costs[i]),
+            }
+            for i in range(len(self))
+        ]
+
 class HierarchicalTaskDecomposition:
     """Novel algorithm for mobile UI task decomposition using multi-agent coordination"""
-    
+
+    # Maps each subtask type to its capability axis: 0=planning, 1=execution, 2=verification
+    SUBTASK_AXIS = {
+        "analyze_ui": 0,
+        "plan_actions": 0,
+        "execute_gesture": 1,
+        "direct_execution": 1,
+        "verify_state": 2,
+        "verify_completion": 2,
+    }
+
+    AGENT_NAMES = ["PlanningAgent", "ExecutionAgent", "VerificationAgent"]
+
+    # Coordination cost matrix indexed [previous_agent_id, current_agent_id];
+    # off-pattern handoffs default to the 0.2 penalty, same-agent runs are free
+    COORD = np.array([
+        [0.0, 0.1, 0.2],
+        [0.2, 0.0, 0.05],
+        [0.15, 0.2, 0.0],
+    ])
+
+    # Agent capability matrix - core research contribution. Built once at
+    # class level and shared by every instance; contiguous float32 keeps the
+    # matmul input half the size of the default float64
+    SPECIALIZATION_MATRIX = np.ascontiguousarray([
+        # Planning, Execution, Verification capabilities
+        [0.9, 0.3, 0.2],  # Planning Agent
+        [0.2, 0.9, 0.3],  # Execution Agent
+        [0.3, 0.2, 0.9],  # Verification Agent
+    ], dtype=np.float32)
+
     def __init__(self):
         self.task_complexity_model = self._build_complexity_model()
-        self.agent_specialization_matrix = self._build_specialization_matrix()
-        
+        self.agent_specialization_matrix = self.SPECIALIZATION_MATRIX
+        # Scratch task-requirement buffer reused across assignment calls;
+        # sized for the largest subtask template and grown on demand
+        self._task_requirements = np.zeros((4, 3), dtype=np.float32)
+
     def _build_complexity_model(self):
         """Build task complexity prediction model based on UI hierarchy depth"""
         return {
@@ -18,111 +114,189 @@ class HierarchicalTaskDecomposition:
             'temporal_dependency_weight': 0.25
         }
     
-    def _build_specialization_matrix(self):
-        """Agent capability matrix - core research contribution"""
-        return np.array([
-            # Planning, Execution, Verification capabilities
-            [0.9, 0.3, 0.2],  # Planning Agent
-            [0.2, 0.9, 0.3],  # Execution Agent  
-            [0.3, 0.2, 0.9],  # Verification Agent
-        ])
-    
     def decompose_task(self, task_goal: str, ui_state: Dict) -> List[Dict]:
         """
         Novel hierarchical decomposition algorithm
         Research contribution: Optimal agent assignment based on task complexity
         """
-        # Calculate task complexity vector
-        complexity = self._calculate_complexity_vector(ui_state)
-        
-        # Generate subtasks using complexity-aware decomposition
-        subtasks = self._generate_subtasks(task_goal, complexity)
-        
-        # Assign agents using Hungarian algorithm variant
+        ui_depth, element_count, interaction_types = self._ui_signature(ui_state)
+        return self._decompose_core(ui_depth, element_count, interaction_types).to_dicts()
+
+    def decompose_tasks(self, ui_states: List[Dict]) -> List[AssignmentBatch]:
+        """Batched decomposition over many UI states.
+
+        Extracts all UI signatures up front, deduplicates them, and runs the
+        memoized core once per unique signature — the full AndroidWorld task
+        suite collapses to a handful of core evaluations. Returns one
+        struct-of-arrays AssignmentBatch per UI state so aggregations stay
+        vectorized.
+        """
+        if not ui_states:
+            return []
+
+        signatures = np.array([self._ui_signature(s) for s in ui_states], dtype=np.intp)
+        unique_signatures, inverse = np.unique(signatures, axis=0, return_inverse=True)
+        unique_results = [
+            self._decompose_core(int(depth), int(element_count), int(interaction_types))
+            for depth, element_count, interaction_types in unique_signatures
+        ]
+        return [unique_results[j] for j in inverse]
+
+    @functools.lru_cache(maxsize=4096)
+    def _decompose_core(self, ui_depth: int, element_count: int, interaction_types: int) -> AssignmentBatch:
+        """Memoized decomposition pipeline keyed on the UI signature.
+
+        Many UI states collapse to the same (depth, element count, interaction
+        types) triple, so repeated signatures become O(1) cache hits. Returns
+        a read-only AssignmentBatch shared between cache hits.
+        """
+        if _kernel.NUMBA_AVAILABLE:
+            # Compiled fast path: run the whole pipeline in one jitted kernel
+            types, complexities, priorities, agent_ids, confidences, coord_costs = _kernel.core(
+                ui_depth, element_count, interaction_types,
+                self.agent_specialization_matrix
+            )
+            return AssignmentBatch(
+                subtask_type_ids=types,
+                complexities=complexities,
+                priorities=priorities,
+                agent_ids=agent_ids.astype(np.int8),
+                confidences=confidences,
+                coord_costs=coord_costs,
+            )
+
+        complexity = self._complexity_from_signature(ui_depth, element_count, interaction_types)
+        # Hand native floats to subtask generation so the dicts hold Python
+        # scalars instead of boxed 0-d ndarrays
+        subtasks = self._generate_subtasks("", tuple(complexity.tolist()))
         assignments = self._optimal_agent_assignment(subtasks, complexity)
-        
-        return assignments
+        type_ids = {name: i for i, name in enumerate(_kernel.SUBTASK_TYPE_NAMES)}
+        agent_ids = {name: i for i, name in enumerate(self.AGENT_NAMES)}
+        n = len(assignments)
+        return AssignmentBatch(
+            subtask_type_ids=np.fromiter(
+                (type_ids[a["subtask"]["type"]] for a in assignments), dtype=np.intp, count=n),
+            complexities=np.fromiter(
+                (a["subtask"]["complexity"] for a in assignments), dtype=np.float64, count=n),
+            priorities=np.fromiter(
+                (a["subtask"]["priority"] for a in assignments), dtype=np.intp, count=n),
+            agent_ids=np.fromiter(
+                (agent_ids[a["assigned_agent"]] for a in assignments), dtype=np.int8, count=n),
+            confidences=np.fromiter(
+                (a["confidence_score"] for a in assignments), dtype=np.float64, count=n),
+            coord_costs=np.fromiter(
+                (a["coordination_cost"] for a in assignments), dtype=np.float64, count=n),
+        )
+
+    def _ui_signature(self, ui_state: Dict) -> Tuple[int, int, int]:
+        """Extract the (depth, element count, interaction types) triple from a UI state"""
+        ui_depth = ui_state.get('hierarchy_depth', 1)
+
+        # Count elements and collect their types in one pass over the list
+        element_count = 0
+        types = set()
+        for el in ui_state.get('elements') or ():
+            element_count += 1
+            types.add(el.get('type', 'unknown'))
+
+        return ui_depth, element_count, len(types)
     
     def _calculate_complexity_vector(self, ui_state: Dict) -> np.ndarray:
         """Calculate 3D complexity vector: [planning, execution, verification]"""
-        ui_depth = ui_state.get('hierarchy_depth', 1)
-        element_count = len(ui_state.get('elements', []))
-        interaction_types = len(set(el.get('type', 'unknown') for el in ui_state.get('elements', [])))
-        
+        return self._complexity_from_signature(*self._ui_signature(ui_state))
+
+    def _complexity_from_signature(self, ui_depth: int, element_count: int,
+                                   interaction_types: int) -> np.ndarray:
+        """Complexity vector from a precomputed UI signature"""
         # Novel complexity calculation using weighted geometric mean
-        planning_complexity = (ui_depth ** 0.5) * (interaction_types ** 0.3)
-        execution_complexity = (element_count ** 0.4) * (ui_depth ** 0.2)  
-        verification_complexity = (interaction_types ** 0.6) * (ui_depth ** 0.1)
-        
+        planning_complexity = math.sqrt(ui_depth) * _pow_small(interaction_types, _POW03, 0.3)
+        execution_complexity = _pow_small(element_count, _POW04, 0.4) * _pow_small(ui_depth, _POW02, 0.2)
+        verification_complexity = _pow_small(interaction_types, _POW06, 0.6) * _pow_small(ui_depth, _POW01, 0.1)
+
         return np.array([planning_complexity, execution_complexity, verification_complexity])
     
-    def _generate_subtasks(self, goal: str, complexity: np.ndarray) -> List[Dict]:
+    def _generate_subtasks(self, goal: str, complexity: Tuple[float, float, float]) -> List[Dict]:
         """Generate subtasks based on complexity analysis"""
+        planning, execution, verification = complexity
+        mean_complexity = (planning + execution + verification) / 3.0
+
         # Adaptive subtask generation based on complexity threshold
-        if np.mean(complexity) > 2.0:
+        if mean_complexity > 2.0:
             # High complexity: fine-grained decomposition
             return [
-                {"type": "analyze_ui", "complexity": complexity[0], "priority": 1},
-                {"type": "plan_actions", "complexity": complexity[0], "priority": 2},
-                {"type": "execute_gesture", "complexity": complexity[1], "priority": 3},
-                {"type": "verify_state", "complexity": complexity[2], "priority": 4}
+                {"type": "analyze_ui", "complexity": planning, "priority": 1},
+                {"type": "plan_actions", "complexity": planning, "priority": 2},
+                {"type": "execute_gesture", "complexity": execution, "priority": 3},
+                {"type": "verify_state", "complexity": verification, "priority": 4}
             ]
         else:
             # Low complexity: coarse-grained decomposition
             return [
-                {"type": "direct_execution", "complexity": np.mean(complexity), "priority": 1},
-                {"type": "verify_completion", "complexity": complexity[2], "priority": 2}
+                {"type": "direct_execution", "complexity": mean_complexity, "priority": 1},
+                {"type": "verify_completion", "complexity": verification, "priority": 2}
             ]
     
     def _optimal_agent_assignment(self, subtasks: List[Dict], complexity: np.ndarray) -> List[Dict]:
         """
-        Core research contribution: Optimal agent assignment using modified Hungarian algorithm
+        Core research contribution: Optimal agent assignment using the Hungarian algorithm
         Maximizes total capability while minimizing coordination overhead
         """
+        n = len(subtasks)
+
+        # Build the (n, 3) task-requirement matrix in one vectorized pass:
+        # each row has the subtask's complexity on its capability axis, 0 elsewhere
+        axis_idx = np.fromiter(
+            (self.SUBTASK_AXIS[s["type"]] for s in subtasks), dtype=np.intp, count=n
+        )
+        complexities = np.fromiter(
+            (s["complexity"] for s in subtasks), dtype=np.float32, count=n
+        )
+        if n > self._task_requirements.shape[0]:
+            self._task_requirements = np.zeros((n, 3), dtype=np.float32)
+        task_requirements = self._task_requirements[:n]
+        task_requirements[:] = 0.0
+        task_requirements[np.arange(n), axis_idx] = complexities
+
+        # Single matmul scores all agents against all subtasks at once (3, n)
+        agent_scores = self.agent_specialization_matrix @ task_requirements.T
+
+        # True Hungarian step: each agent row is replicated ceil(n / 3) times
+        # so agents may take several subtasks, then linear_sum_assignment
+        # maximizes the total capability score globally. For the two subtask
+        # templates the generator emits this coincides with the per-subtask
+        # argmax the compiled kernel uses, but it stays optimal if the
+        # templates or specialization matrix ever change.
+        replicas = -(-n // 3)
+        optimal_agents = np.empty(n, dtype=np.intp)
+        if agent_scores.any():
+            row_ind, col_ind = linear_sum_assignment(-np.repeat(agent_scores, replicas, axis=0))
+            optimal_agents[col_ind] = row_ind // replicas
+        else:
+            # Empty UI states score zero everywhere; mirror the kernel's
+            # first-agent pick instead of an arbitrary matching
+            optimal_agents[:] = 0
+        score_totals = agent_scores.sum(axis=0)
+        confidences = np.divide(
+            agent_scores[optimal_agents, np.arange(n)], score_totals,
+            out=np.full(n, np.nan), where=score_totals > 0.0)
+
         assignments = []
-        
-        for subtask in subtasks:
-            # Calculate capability scores for each agent
-            task_complexity_vec = np.array([
-                subtask["complexity"] if subtask["type"] in ["analyze_ui", "plan_actions"] else 0,
-                subtask["complexity"] if subtask["type"] in ["execute_gesture", "direct_execution"] else 0,
-                subtask["complexity"] if subtask["type"] in ["verify_state", "verify_completion"] else 0
-            ])
-            
-            # Agent selection using dot product of specialization and task requirements
-            agent_scores = self.agent_specialization_matrix @ task_complexity_vec
-            optimal_agent = np.argmax(agent_scores)
-            
+        last_agent_id = -1
+        for i, subtask in enumerate(subtasks):
+            agent_id = optimal_agents[i]
             assignments.append({
                 "subtask": subtask,
-                "assigned_agent": ["PlanningAgent", "ExecutionAgent", "VerificationAgent"][optimal_agent],
-                "confidence_score": agent_scores[optimal_agent] / np.sum(agent_scores),
-                "coordination_cost": self._calculate_coordination_cost(optimal_agent, assignments)
+                "assigned_agent": self.AGENT_NAMES[agent_id],
+                "confidence_score": confidences[i],
+                "coordination_cost": self._coord_cost(last_agent_id, agent_id)
             })
-        
+            last_agent_id = agent_id
+
         return assignments
     
-    def _calculate_coordination_cost(self, agent_id: int, previous_assignments: List[Dict]) -> float:
-        """Calculate communication overhead between agents"""
-        if not previous_assignments:
-            return 0.0
-        
-        last_agent = previous_assignments[-1]["assigned_agent"] 
-        agent_names = ["PlanningAgent", "ExecutionAgent", "VerificationAgent"]
-        current_agent = agent_names[agent_id]
-        
-        # Coordination cost matrix based on agent interaction patterns
-        coordination_matrix = {
-            ("PlanningAgent", "ExecutionAgent"): 0.1,
-            ("ExecutionAgent", "VerificationAgent"): 0.05, 
-            ("VerificationAgent", "PlanningAgent"): 0.15,
-            # Same agent continuation
-            ("PlanningAgent", "PlanningAgent"): 0.0,
-            ("ExecutionAgent", "ExecutionAgent"): 0.0,
-            ("VerificationAgent", "VerificationAgent"): 0.0,
-        }
-        
-        return coordination_matrix.get((last_agent, current_agent), 0.2)
+    def _coord_cost(self, prev_agent_id: int, agent_id: int) -> float:
+        """Communication overhead between consecutive agents; -1 means no predecessor"""
+        return 0.0 if prev_agent_id < 0 else self.COORD[prev_agent_id, agent_id]
 
 def demonstrate_algorithm():
     """Demonstrate the novel coordination algorithm with quantified results"""
@@ -154,46 +328,43 @@ def demonstrate_algorithm():
         }
     ]
     
-    print("🧠 Novel Multi-Agent Coordination Algorithm")
-    print("=" * 50)
-    print("Research Contribution: Hierarchical Task Decomposition with Optimal Agent Assignment")
-    print()
-    
-    for test_case in test_cases:
-        print(f"📱 Task: {test_case['name']}")
-        
-        # Run the algorithm
-        assignments = algorithm.decompose_task(test_case['name'], test_case['ui_state'])
-        
-        # Calculate metrics
-        total_confidence = sum(a['confidence_score'] for a in assignments)
-        total_coordination_cost = sum(a['coordination_cost'] for a in assignments)
-        
-        print(f"  Subtasks Generated: {len(assignments)}")
-        print(f"  Average Confidence: {total_confidence/len(assignments):.3f}")
-        print(f"  Coordination Overhead: {total_coordination_cost:.3f}")
-        print(f"  Agent Distribution:")
-        
-        agent_counts = {}
-        for assignment in assignments:
-            agent = assignment['assigned_agent']
-            agent_counts[agent] = agent_counts.get(agent, 0) + 1
-        
+    # Accumulate the report in one buffer and emit it with a single print
+    out = io.StringIO()
+    out.write("🧠 Novel Multi-Agent Coordination Algorithm\n")
+    out.write("=" * 50 + "\n")
+    out.write("Research Contribution: Hierarchical Task Decomposition with Optimal Agent Assignment\n\n")
+
+    # Run the algorithm over all test cases in one batched call
+    batches = algorithm.decompose_tasks([tc["ui_state"] for tc in test_cases])
+
+    for test_case, batch in zip(test_cases, batches):
+        out.write(f"📱 Task: {test_case['name']}\n")
+
+        # Metrics are single reductions over the batch arrays
+        out.write(f"  Subtasks Generated: {len(batch)}\n")
+        out.write(f"  Average Confidence: {batch.confidences.mean():.3f}\n")
+        out.write(f"  Coordination Overhead: {batch.coord_costs.sum():.3f}\n")
+        out.write(f"  Agent Distribution:\n")
+
+        agent_counts = Counter(
+            HierarchicalTaskDecomposition.AGENT_NAMES[i] for i in batch.agent_ids)
         for agent, count in agent_counts.items():
-            print(f"    {agent}: {count} tasks")
-        print()
-    
-    print("📊 Algorithm Performance Metrics:")
-    print("  • Complexity-aware decomposition reduces planning errors by ~23%")
-    print("  • Optimal agent assignment improves execution efficiency by ~18%") 
-    print("  • Coordination cost minimization reduces overhead by ~31%")
-    print("  • Scalable to 116+ AndroidWorld tasks with O(n²) complexity")
-    
-    print("\n🎓 Research Contributions:")
-    print("  1. Novel hierarchical task decomposition for mobile UI automation")
-    print("  2. Multi-agent specialization matrix with capability modeling")
-    print("  3. Coordination cost optimization using modified Hungarian algorithm")
-    print("  4. Complexity-aware subtask generation with adaptive granularity")
+            out.write(f"    {agent}: {count} tasks\n")
+        out.write("\n")
+
+    out.write("📊 Algorithm Performance Metrics:\n")
+    out.write("  • Complexity-aware decomposition reduces planning errors by ~23%\n")
+    out.write("  • Optimal agent assignment improves execution efficiency by ~18%\n")
+    out.write("  • Coordination cost minimization reduces overhead by ~31%\n")
+    out.write("  • Scalable to 116+ AndroidWorld tasks with O(n²) complexity\n")
+
+    out.write("\n🎓 Research Contributions:\n")
+    out.write("  1. Novel hierarchical task decomposition for mobile UI automation\n")
+    out.write("  2. Multi-agent specialization matrix with capability modeling\n")
+    out.write("  3. Coordination cost optimization using modified Hungarian algorithm\n")
+    out.write("  4. Complexity-aware subtask generation with adaptive granularity\n")
+
+    print(out.getvalue(), end="")
 
 if __name__ == "__main__":
     demonstrate_algorithm()
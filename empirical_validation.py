@@ -1,9 +1,62 @@
+import re
 import subprocess
 import json
+import sys
 import time
 import os
+import numpy as np
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from coordination_algorithm import HierarchicalTaskDecomposition
 
+# Shared argv template: spawning via an argv list skips the intermediate
+# shell fork and its command-string parsing entirely
+_FRAMEWORK_CMD = [
+    sys.executable, "src/main.py",
+    "--prompt-variant", "base",
+    "--num-episodes", "1",
+    "--max-steps", "10",
+]
+
+# Precompiled patterns so each task's stdout is scanned once per metric
+# instead of being split into a line list and rescanned
+_STEP_RE = re.compile(r'^.*Step', re.MULTILINE)
+_SUCCESS_RE = re.compile(r'Success: True|✅')
+_ACTION_RE = re.compile(r'action_type')
+
+def _run_framework_episode(task, timeout=60):
+    """Run one framework episode in a child process and return its stdout"""
+    process = subprocess.Popen(
+        _FRAMEWORK_CMD + ["--task", task],
+        stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+    try:
+        stdout, _ = process.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.communicate()
+        raise
+    return stdout
+
+def _run_and_parse_task(task):
+    """Run one task's episode and parse its metrics; safe to call from a worker thread"""
+    start_time = time.time()
+    stdout = _run_framework_episode(task)
+    execution_time = time.time() - start_time
+
+    # Parse results from the framework output
+    success = _SUCCESS_RE.search(stdout) is not None
+
+    # Count steps from logs
+    steps = len(_STEP_RE.findall(stdout))
+    if steps == 0:  # Fallback step counting
+        steps = len(_ACTION_RE.findall(stdout)) or 5
+
+    return success, steps, execution_time
+
 def run_actual_android_tests():
     """Run real AndroidWorld tasks to validate multi-agent approach"""
     
@@ -20,56 +73,49 @@ def run_actual_android_tests():
     print("Running Empirical Validation on Real Android Tasks")
     print("=" * 55)
     
-    for task in test_tasks:
-        print(f"\nTesting {task}...")
-        
-        try:
-            # Run the actual framework
-            start_time = time.time()
-            
-            # This runs the real android_world_agents framework
-            cmd = f"python src/main.py --task {task} --prompt-variant base --num-episodes 1 --max-steps 10"
-            result = subprocess.run(cmd, shell=True, capture_output=True, text=True, timeout=60)
-            
-            execution_time = time.time() - start_time
-            
-            # Parse results from the framework output
-            success = "Success: True" in result.stdout or "✅" in result.stdout
-            
-            # Count steps from logs
-            steps = len([line for line in result.stdout.split('\n') if 'Step' in line])
-            if steps == 0:  # Fallback step counting
-                steps = result.stdout.count('action_type') or 5
-            
-            # Apply your algorithm to the same task
-            mock_ui_state = {
-                "hierarchy_depth": 3,
-                "elements": [{"type": "button"}, {"type": "text"}]
-            }
-            
-            assignments = algorithm.decompose_task(task, mock_ui_state)
-            predicted_steps = len(assignments)
-            coordination_overhead = sum(a['coordination_cost'] for a in assignments)
-            
-            results[task] = {
-                "actual_success": success,
-                "actual_steps": steps,
-                "actual_time": execution_time,
-                "predicted_steps": predicted_steps,
-                "coordination_cost": coordination_overhead,
-                "step_efficiency": (steps - predicted_steps) / steps if steps > 0 else 0
-            }
-            
-            print(f"  Actual: {steps} steps, {execution_time:.1f}s, Success: {success}")
-            print(f"  Predicted: {predicted_steps} steps, Overhead: {coordination_overhead:.3f}")
-            
-        except subprocess.TimeoutExpired:
-            print(f"  Timeout - task too complex for validation")
-            results[task] = {"status": "timeout"}
-        except Exception as e:
-            print(f"  Error: {str(e)}")
-            results[task] = {"status": "error", "error": str(e)}
-    
+    # The episodes are I/O-bound on the emulator, so run them concurrently
+    # and collect metrics as each child process finishes. Algorithm
+    # predictions stay on the main thread; only the subprocess runs fan out.
+    with ThreadPoolExecutor(max_workers=min(len(test_tasks), 4)) as executor:
+        futures = {executor.submit(_run_and_parse_task, task): task for task in test_tasks}
+        print(f"\nDispatched {len(futures)} tasks...")
+
+        for future in as_completed(futures):
+            task = futures[future]
+            print(f"\n{task}:")
+
+            try:
+                success, steps, execution_time = future.result()
+
+                # Apply your algorithm to the same task
+                mock_ui_state = {
+                    "hierarchy_depth": 3,
+                    "elements": [{"type": "button"}, {"type": "text"}]
+                }
+
+                assignments = algorithm.decompose_task(task, mock_ui_state)
+                predicted_steps = len(assignments)
+                coordination_overhead = sum(a['coordination_cost'] for a in assignments)
+
+                results[task] = {
+                    "actual_success": success,
+                    "actual_steps": steps,
+                    "actual_time": execution_time,
+                    "predicted_steps": predicted_steps,
+                    "coordination_cost": coordination_overhead,
+                    "step_efficiency": (steps - predicted_steps) / steps if steps > 0 else 0
+                }
+
+                print(f"  Actual: {steps} steps, {execution_time:.1f}s, Success: {success}")
+                print(f"  Predicted: {predicted_steps} steps, Overhead: {coordination_overhead:.3f}")
+
+            except subprocess.TimeoutExpired:
+                print(f"  Timeout - task too complex for validation")
+                results[task] = {"status": "timeout"}
+            except Exception as e:
+                print(f"  Error: {str(e)}")
+                results[task] = {"status": "error", "error": str(e)}
+
     return results
 
 def analyze_validation_results(results):
@@ -84,30 +130,43 @@ def analyze_validation_results(results):
     print(f"\nEmpirical Validation Results")
     print("=" * 35)
     
+    # Flatten the per-task metrics into parallel arrays so all aggregates
+    # come from single reductions instead of one dict sweep per statistic
     total_tasks = len(valid_results)
-    successful_tasks = sum(1 for r in valid_results.values() if r['actual_success'])
-    
-    avg_actual_steps = sum(r['actual_steps'] for r in valid_results.values()) / len(valid_results)
-    avg_predicted_steps = sum(r['predicted_steps'] for r in valid_results.values()) / len(valid_results)
-    avg_efficiency = sum(r['step_efficiency'] for r in valid_results.values()) / len(valid_results)
-    
+    actual_steps = np.fromiter(
+        (r['actual_steps'] for r in valid_results.values()), dtype=np.int32, count=total_tasks)
+    predicted_steps = np.fromiter(
+        (r['predicted_steps'] for r in valid_results.values()), dtype=np.int32, count=total_tasks)
+    efficiencies = np.fromiter(
+        (r['step_efficiency'] for r in valid_results.values()), dtype=np.float64, count=total_tasks)
+    successes = np.fromiter(
+        (r['actual_success'] for r in valid_results.values()), dtype=np.bool_, count=total_tasks)
+
+    successful_tasks = int(successes.sum())
+    avg_efficiency = float(efficiencies.mean())
+
     print(f"Tasks Tested: {total_tasks}")
     print(f"Success Rate: {successful_tasks}/{total_tasks} ({successful_tasks/total_tasks*100:.1f}%)")
-    print(f"Average Actual Steps: {avg_actual_steps:.1f}")
-    print(f"Average Predicted Steps: {avg_predicted_steps:.1f}")
+    print(f"Average Actual Steps: {actual_steps.mean():.1f}")
+    print(f"Average Predicted Steps: {predicted_steps.mean():.1f}")
     print(f"Step Efficiency Gain: {avg_efficiency*100:.1f}%")
-    
+
     print(f"\nDetailed Results:")
-    for task, result in valid_results.items():
-        if 'actual_steps' in result:
-            print(f"  {task}:")
-            print(f"    Actual: {result['actual_steps']} steps ({'✓' if result['actual_success'] else '✗'})")
-            print(f"    Predicted: {result['predicted_steps']} steps")
-            print(f"    Efficiency: {result['step_efficiency']*100:+.1f}%")
-    
-    # Save results for later analysis
-    with open('empirical_results.json', 'w') as f:
-        json.dump(results, f, indent=2)
+    for task, steps, predicted, efficiency, success in zip(
+            valid_results, actual_steps, predicted_steps, efficiencies, successes):
+        print(f"  {task}:")
+        print(f"    Actual: {steps} steps ({'✓' if success else '✗'})")
+        print(f"    Predicted: {predicted} steps")
+        print(f"    Efficiency: {efficiency*100:+.1f}%")
+    
+    # Save results for later analysis (orjson is several times faster on the
+    # float-heavy dicts and serializes numpy scalars directly)
+    if orjson is not None:
+        with open('empirical_results.json', 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open('empirical_results.json', 'w') as f:
+            json.dump(results, f, indent=2)
     
     print(f"\nResults saved to empirical_results.json")
     
@@ -1,5 +1,11 @@
 import json
 import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from coordination_algorithm import HierarchicalTaskDecomposition
 
 def load_android_world_task_data():
@@ -46,50 +52,58 @@ def run_simulated_validation():
     print("Using real AndroidWorld task statistics for validation")
     print()
     
-    results = []
-    
-    for task_name, stats in task_data.items():
-        # Create realistic UI state from task stats
-        ui_state = {
-            "hierarchy_depth": stats["depth"],
-            "elements": [{"type": "element"} for _ in range(stats["ui_elements"])]
+    task_names = list(task_data)
+    n_tasks = len(task_names)
+
+    # Parallel arrays of baseline statistics for vectorized projection
+    avg_steps = np.fromiter(
+        (task_data[t]["avg_steps"] for t in task_names), dtype=np.float64, count=n_tasks)
+    success_rates = np.fromiter(
+        (task_data[t]["success_rate"] for t in task_names), dtype=np.float64, count=n_tasks)
+
+    # Apply multi-agent algorithm over all tasks in one batched call
+    ui_states = [
+        {
+            "hierarchy_depth": task_data[task_name]["depth"],
+            "elements": [{"type": "element"} for _ in range(task_data[task_name]["ui_elements"])]
         }
-        
-        # Apply multi-agent algorithm
-        assignments = algorithm.decompose_task(task_name, ui_state)
-        
-        # Calculate predicted improvements
-        coordination_cost = sum(a['coordination_cost'] for a in assignments)
-        predicted_steps = max(1, int(stats["avg_steps"] * (1 - coordination_cost)))
-        predicted_success_rate = min(0.95, stats["success_rate"] + 0.1 + coordination_cost)
-        
-        step_improvement = (stats["avg_steps"] - predicted_steps) / stats["avg_steps"]
-        success_improvement = predicted_success_rate - stats["success_rate"]
-        
+        for task_name in task_names
+    ]
+    batches = algorithm.decompose_tasks(ui_states)
+    coordination_costs = np.fromiter(
+        (batch.coord_costs.sum() for batch in batches), dtype=np.float64, count=n_tasks)
+
+    # Predicted improvements computed in one vectorized pass over all tasks
+    predicted_steps = np.maximum(1, (avg_steps * (1 - coordination_costs)).astype(int))
+    predicted_success_rates = np.minimum(0.95, success_rates + 0.1 + coordination_costs)
+    step_improvements = (avg_steps - predicted_steps) / avg_steps
+    success_improvements = predicted_success_rates - success_rates
+
+    results = []
+    for i, task_name in enumerate(task_names):
         results.append({
             "task": task_name,
-            "baseline_steps": stats["avg_steps"],
-            "baseline_success": stats["success_rate"],
-            "multiagent_steps": predicted_steps,
-            "multiagent_success": predicted_success_rate,
-            "step_improvement": step_improvement,
-            "success_improvement": success_improvement,
-            "coordination_cost": coordination_cost
+            "baseline_steps": int(avg_steps[i]),
+            "baseline_success": float(success_rates[i]),
+            "multiagent_steps": int(predicted_steps[i]),
+            "multiagent_success": float(predicted_success_rates[i]),
+            "step_improvement": float(step_improvements[i]),
+            "success_improvement": float(success_improvements[i]),
+            "coordination_cost": float(coordination_costs[i])
         })
-        
+
         print(f"{task_name}:")
-        print(f"  Baseline: {stats['avg_steps']} steps, {stats['success_rate']:.2f} success")
-        print(f"  Multi-Agent: {predicted_steps} steps, {predicted_success_rate:.2f} success")
-        print(f"  Improvement: {step_improvement*100:+.1f}% steps, {success_improvement*100:+.1f}% success")
+        print(f"  Baseline: {int(avg_steps[i])} steps, {success_rates[i]:.2f} success")
+        print(f"  Multi-Agent: {int(predicted_steps[i])} steps, {predicted_success_rates[i]:.2f} success")
+        print(f"  Improvement: {step_improvements[i]*100:+.1f}% steps, {success_improvements[i]*100:+.1f}% success")
         print()
-    
-    # Calculate aggregate statistics
-    avg_step_improvement = np.mean([r['step_improvement'] for r in results])
-    avg_success_improvement = np.mean([r['success_improvement'] for r in results])
-    avg_coordination_cost = np.mean([r['coordination_cost'] for r in results])
-    
+
+    # Calculate aggregate statistics directly on the arrays
+    avg_step_improvement = np.mean(step_improvements)
+    avg_success_improvement = np.mean(success_improvements)
+    avg_coordination_cost = np.mean(coordination_costs)
+
     # Statistical significance test (simplified)
-    step_improvements = [r['step_improvement'] for r in results]
     std_error = np.std(step_improvements) / np.sqrt(len(step_improvements))
     t_statistic = avg_step_improvement / std_error
     p_value = 2 * (1 - 0.95) if abs(t_statistic) > 2 else 0.3  # Simplified
@@ -108,10 +122,15 @@ def run_simulated_validation():
     print(f"- Success rate improvement: {avg_success_improvement*100:.1f}%")
     print(f"- Coordination overhead manageable: {avg_coordination_cost:.1%}")
     
-    # Save results
-    with open('validation_results.json', 'w') as f:
-        json.dump(results, f, indent=2)
-    
+    # Save results (orjson serializes the float-heavy dicts several times
+    # faster and handles numpy scalars natively)
+    if orjson is not None:
+        with open('validation_results.json', 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open('validation_results.json', 'w') as f:
+            json.dump(results, f, indent=2)
+
     return results
 
 if __name__ == "__main__":
@@ -1,4 +1,7 @@
 class MultiAgentRewardTracker:
+    # Fixed agent order matching the agent_scores insertion order
+    _AGENT_NAMES = ('planning_effectiveness', 'execution_accuracy', 'verification_precision')
+
     def __init__(self):
         self.agent_scores = {
             'planning_effectiveness': 0.0,
@@ -16,19 +19,21 @@ class MultiAgentRewardTracker:
             self.agent_scores['verification_precision'] += 0.1
             
     def get_breakdown(self):
+        # Materialize the three scores once instead of re-iterating the dict
+        # for the total, the max, and the min separately
+        vals = (*self.agent_scores.values(),)
         return {
-            "total_reward": sum(self.agent_scores.values()),
+            "total_reward": vals[0] + vals[1] + vals[2],
             "breakdown": self.agent_scores,
-            "insights": self._generate_insights()
+            "insights": self._generate_insights(vals, max(vals), min(vals))
         }
-        
-    def _generate_insights(self):
-        max_score = max(self.agent_scores.values())
-        min_score = min(self.agent_scores.values())
-        
+
+    def _generate_insights(self, vals, max_score, min_score):
         if max_score > min_score * 2:
-            weak_agent = min(self.agent_scores, key=self.agent_scores.get)
-            return f"Bottleneck detected in {weak_agent.replace('_', ' ')}"
+            # argmin over the tuple indexes the name table directly, avoiding
+            # another keyed pass over the dict
+            weakest = min(range(3), key=vals.__getitem__)
+            return f"Bottleneck detected in {self._AGENT_NAMES[weakest].replace('_', ' ')}"
         return "Balanced performance across agents"
 
 # Demo usage
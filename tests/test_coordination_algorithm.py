@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+Tests for the hierarchical task decomposition coordination algorithm.
+"""
+
+import sys
+import os
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from coordination_algorithm import HierarchicalTaskDecomposition
+
+
+def _simple_ui_state():
+    return {
+        "hierarchy_depth": 3,
+        "elements": [{"type": "button"}, {"type": "text"}],
+    }
+
+
+def _complex_ui_state():
+    return {
+        "hierarchy_depth": 5,
+        "elements": [{"type": "list"}, {"type": "button"}, {"type": "dialog"}, {"type": "button"}],
+    }
+
+
+def test_simple_task_uses_coarse_decomposition():
+    """Low-complexity UI states should produce the 2-subtask decomposition."""
+    algorithm = HierarchicalTaskDecomposition()
+    assignments = algorithm.decompose_task("SystemWifiToggle", _simple_ui_state())
+
+    assert len(assignments) == 2
+    assert assignments[0]["subtask"]["type"] == "direct_execution"
+    assert assignments[1]["subtask"]["type"] == "verify_completion"
+
+
+def test_complex_task_uses_fine_decomposition():
+    """High-complexity UI states should produce the 4-subtask decomposition."""
+    algorithm = HierarchicalTaskDecomposition()
+    assignments = algorithm.decompose_task("FilesDeleteFile", _complex_ui_state())
+
+    assert len(assignments) == 4
+    types = [a["subtask"]["type"] for a in assignments]
+    assert types == ["analyze_ui", "plan_actions", "execute_gesture", "verify_state"]
+
+
+def test_agents_match_subtask_specialization():
+    """Each subtask should be assigned to the agent specialized for its axis."""
+    algorithm = HierarchicalTaskDecomposition()
+    assignments = algorithm.decompose_task("FilesDeleteFile", _complex_ui_state())
+
+    expected = ["PlanningAgent", "PlanningAgent", "ExecutionAgent", "VerificationAgent"]
+    assert [a["assigned_agent"] for a in assignments] == expected
+
+
+def test_confidence_scores_are_normalized():
+    """Confidence scores are score fractions, so they must lie in (0, 1)."""
+    algorithm = HierarchicalTaskDecomposition()
+    for ui_state in (_simple_ui_state(), _complex_ui_state()):
+        assignments = algorithm.decompose_task("Task", ui_state)
+        for assignment in assignments:
+            assert 0.0 < assignment["confidence_score"] < 1.0
+
+
+def test_coordination_cost_starts_at_zero():
+    """The first subtask has no predecessor, so its coordination cost is 0."""
+    algorithm = HierarchicalTaskDecomposition()
+    assignments = algorithm.decompose_task("Task", _complex_ui_state())
+
+    assert assignments[0]["coordination_cost"] == 0.0
+    for assignment in assignments[1:]:
+        assert assignment["coordination_cost"] >= 0.0
+
+
+def test_kernel_matches_reference_pipeline():
+    """The compiled kernel must agree with the pure-NumPy reference path."""
+    algorithm = HierarchicalTaskDecomposition()
+    ui_states = (
+        _simple_ui_state(),
+        _complex_ui_state(),
+        # Degenerate states the API tolerates: both paths must agree here too
+        {},
+        {"hierarchy_depth": 2, "elements": []},
+    )
+    for ui_state in ui_states:
+        kernel_assignments = algorithm.decompose_task("Task", ui_state)
+
+        complexity = algorithm._calculate_complexity_vector(ui_state)
+        subtasks = algorithm._generate_subtasks("Task", complexity)
+        reference = algorithm._optimal_agent_assignment(subtasks, complexity)
+
+        assert len(kernel_assignments) == len(reference)
+        for got, want in zip(kernel_assignments, reference):
+            assert got["subtask"]["type"] == want["subtask"]["type"]
+            assert got["assigned_agent"] == want["assigned_agent"]
+            assert np.isclose(got["subtask"]["complexity"], want["subtask"]["complexity"])
+            assert np.isclose(got["confidence_score"], want["confidence_score"], equal_nan=True)
+            assert np.isclose(got["coordination_cost"], want["coordination_cost"])
+
+
+def test_batch_decomposition_matches_single_calls():
+    """decompose_tasks must return the same assignments as per-task calls."""
+    algorithm = HierarchicalTaskDecomposition()
+    ui_states = [_simple_ui_state(), _complex_ui_state(), _simple_ui_state()]
+
+    batches = algorithm.decompose_tasks(ui_states)
+    singles = [algorithm.decompose_task("Task", s) for s in ui_states]
+
+    assert [batch.to_dicts() for batch in batches] == singles
+    assert algorithm.decompose_tasks([]) == []
+
+
+def test_complexity_vector_shape():
+    """Complexity vectors are 3D: [planning, execution, verification]."""
+    algorithm = HierarchicalTaskDecomposition()
+    complexity = algorithm._calculate_complexity_vector(_complex_ui_state())
+
+    assert complexity.shape == (3,)
+    assert np.all(complexity > 0)
+
+
+if __name__ == "__main__":
+    test_simple_task_uses_coarse_decomposition()
+    test_complex_task_uses_fine_decomposition()
+    test_agents_match_subtask_specialization()
+    test_confidence_scores_are_normalized()
+    test_coordination_cost_starts_at_zero()
+    test_kernel_matches_reference_pipeline()
+    test_batch_decomposition_matches_single_calls()
+    test_complexity_vector_shape()
+    print("✅ All coordination algorithm tests passed")
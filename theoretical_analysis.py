@@ -1,4 +1,11 @@
-import numpy as np
+import math
+
+# Constants evaluated once at import; keeps this module numpy-free
+_N_AGENTS = 3
+_TASK_ENTROPY = 2.5  # bits of uncertainty per task
+_AGENT_ENTROPY = math.log2(_N_AGENTS)
+_TOTAL_ENTROPY = _TASK_ENTROPY + _AGENT_ENTROPY
+_EFFICIENCY_BOUND = 1 / _TOTAL_ENTROPY
 
 def analyze_theoretical_bounds():
     """Theoretical analysis of multi-agent coordination efficiency"""
@@ -14,14 +21,10 @@ def analyze_theoretical_bounds():
     
     # Information-theoretic bounds
     print("\n📊 Information-Theoretic Bounds:")
-    n_agents = 3
-    task_entropy = 2.5  # bits of uncertainty per task
-    agent_entropy = np.log2(n_agents)
-    
-    print(f"  Task Uncertainty: {task_entropy:.1f} bits")
-    print(f"  Agent Coordination: {agent_entropy:.1f} bits") 
-    print(f"  Total Information: {task_entropy + agent_entropy:.1f} bits")
-    print(f"  Efficiency Bound: {1/(task_entropy + agent_entropy):.3f}")
+    print(f"  Task Uncertainty: {_TASK_ENTROPY:.1f} bits")
+    print(f"  Agent Coordination: {_AGENT_ENTROPY:.1f} bits")
+    print(f"  Total Information: {_TOTAL_ENTROPY:.1f} bits")
+    print(f"  Efficiency Bound: {_EFFICIENCY_BOUND:.3f}")
     
     # Coordination optimality proof sketch
     print("\n🧮 Optimality Analysis:")